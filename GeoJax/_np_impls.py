@@ -0,0 +1,103 @@
+"""Plain NumPy implementations of a few hot vector ops.
+
+JAX pays a fixed dispatch cost per call (tens to hundreds of microseconds),
+which dwarfs the arithmetic when normalise, magnitude or angle are hit with
+small NumPy arrays inside Python loops. The public wrappers in core route
+np.ndarray inputs here so those callers skip the JAX machinery entirely;
+JAX array inputs keep the jitted path.
+
+The functions mirror the semantics of their jitted counterparts in core.
+"""
+
+import numpy as np
+
+_RAD2DEG = 180.0 / np.pi
+
+
+def normalise_np(
+    arr: np.ndarray, eps: float = 1e-12, out: np.ndarray | None = None
+) -> np.ndarray:
+    """NumPy counterpart of core.normalise (fused squared-norm and scale).
+
+    The scale is applied as a multiply by the reciprocal norm rather than a
+    divide, mirroring the rsqrt form of the jitted core. The final multiply
+    writes into out when a buffer is supplied.
+    """
+    ss = np.einsum("...i,...i->...", arr, arr, optimize=True)[..., None]
+    return np.multiply(arr, 1.0 / np.sqrt(np.maximum(ss, eps * eps)), out=out)
+
+
+def magnitude_np(
+    arr: np.ndarray, out: np.ndarray | None = None, safe: bool = False
+) -> np.ndarray:
+    """NumPy counterpart of core.magnitude."""
+    arr = arr.astype(np.float64)
+    if safe:
+        # Rescale by the largest component so the squares cannot overflow.
+        scale = np.maximum(np.abs(arr).max(axis=-1, keepdims=True), 1e-300)
+        scaled = arr / scale
+        ss = np.einsum("...i,...i->...", scaled, scaled, optimize=True)
+        return np.multiply(scale[..., 0], np.sqrt(ss), out=out)
+    return np.sqrt(np.einsum("...i,...i->...", arr, arr, optimize=True), out=out)
+
+
+def euclidean_dist_np(
+    v1: np.ndarray, v2: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """NumPy counterpart of core.euclidean_dist."""
+    v1, v2 = np.atleast_2d(v1), np.atleast_2d(v2)
+    if (v1.shape[0] == v2.shape[0]) or v1.shape[0] == 1 or v2.shape[0] == 1:
+        diff = v1 - v2
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff, optimize=True), out=out)
+    # Mismatched multi-row inputs return NaNs, as in the jitted version.
+    result = np.full(max(v1.shape[0], v2.shape[0]), np.nan)
+    if out is not None:
+        out[...] = result
+        return out
+    return result
+
+
+def reject_np(
+    v: np.ndarray, from_v: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """NumPy counterpart of core.reject (single sweep over the rows)."""
+    dot_v_from_v = np.einsum("...i,...i->...", v, from_v, optimize=True)[..., None]
+    dot_from_v_from_v = np.einsum("...i,...i->...", from_v, from_v, optimize=True)[..., None]
+    return np.subtract(
+        v, (dot_v_from_v / (dot_from_v_from_v + 1e-10)) * from_v, out=out
+    )
+
+
+def _reject_pair_np(v1, v2, n):
+    """NumPy counterpart of core._reject_pair."""
+    nn = np.einsum("...i,...i->...", n, n, optimize=True)[..., None] + 1e-10
+    v1 = v1 - (np.einsum("...i,...i->...", v1, n, optimize=True)[..., None] / nn) * n
+    v2 = v2 - (np.einsum("...i,...i->...", v2, n, optimize=True)[..., None] / nn) * n
+    return v1, v2
+
+
+def angle_np(
+    v1: np.ndarray,
+    v2: np.ndarray,
+    plane_normal: np.ndarray | None = None,
+    assume_normalized: bool = False,
+    to_degree: bool = False,
+) -> np.ndarray:
+    """NumPy counterpart of core.angle."""
+    if plane_normal is not None:
+        v1, v2 = _reject_pair_np(v1, v2, plane_normal)
+
+    dot_products = np.einsum("...i,...i->...", v1, v2, optimize=True)
+
+    # Same branchless atan2 formulation as the jitted core (Lagrange
+    # identity for the cross magnitude; atan2 is scale-invariant).
+    if assume_normalized:
+        cross_sq = 1.0 - dot_products * dot_products
+    else:
+        cross_sq = (
+            np.einsum("...i,...i->...", v1, v1, optimize=True)
+            * np.einsum("...i,...i->...", v2, v2, optimize=True)
+            - dot_products * dot_products
+        )
+    angles = np.arctan2(np.sqrt(np.maximum(cross_sq, 0.0)), dot_products)
+    return angles * _RAD2DEG if to_degree else angles
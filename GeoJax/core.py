@@ -1,12 +1,43 @@
+from functools import partial
+
 from jax import jit, lax
+from jax.scipy.linalg import cho_factor, cho_solve
 import jax.numpy as jnp
 import jax
 import numpy as np
 
+from ._np_impls import (
+    angle_np,
+    euclidean_dist_np,
+    magnitude_np,
+    normalise_np,
+    reject_np,
+)
+
 jax.config.update("jax_enable_x64", True)
 
+# Degree conversion factor, hoisted so XLA folds it as a constant into the
+# preceding multiply (weak-typed, so it follows the operand dtype).
+_RAD2DEG = 180.0 / np.pi
+
 @jit
-def normalise(arr: jnp.ndarray, eps: float = 1e-12) -> jnp.ndarray:
+def _normalise_impl(arr: jnp.ndarray, eps: float = 1e-12) -> jnp.ndarray:
+    """Jitted core of normalise; shape checks live in the wrapper.
+
+    One cached executable covers every batch size: the graph never
+    inspects ndim, and the norm-and-scale is fused into a single
+    reduction plus rsqrt. Flooring the squared norm at eps**2 (rather
+    than adding eps) keeps zero vectors finite while staying exact for
+    every norm above eps, matching the original maximum(norm, eps)
+    semantics.
+    """
+    ss = jnp.sum(arr * arr, axis=-1, keepdims=True)
+    return arr * lax.rsqrt(jnp.maximum(ss, eps * eps))
+
+
+def normalise(
+    arr: jnp.ndarray, eps: float = 1e-12, out: np.ndarray | None = None
+) -> jnp.ndarray:
     """Normalizes a 1D or 2D array using the L2 norm, avoiding division by zero.
 
     Parameters
@@ -15,6 +46,9 @@ def normalise(arr: jnp.ndarray, eps: float = 1e-12) -> jnp.ndarray:
         Input array to be normalized.
     eps : float, optional
         Small constant to prevent division by zero (default is 1e-12).
+    out : np.ndarray | None, optional
+        Pre-allocated result buffer, honoured on the NumPy fast path only
+        (JAX arrays are immutable).
 
     Returns
     -------
@@ -22,19 +56,49 @@ def normalise(arr: jnp.ndarray, eps: float = 1e-12) -> jnp.ndarray:
         Normalized array with the same shape as the input.
     """
     assert arr.ndim in {1, 2}, "Input arr must be 1D or 2D"
-    norm = jnp.linalg.norm(arr, axis=-1, keepdims=True)
-    norm = jnp.maximum(norm, eps)  # Avoid division by zero
-    return arr / norm
+    if isinstance(arr, np.ndarray):
+        return normalise_np(arr, eps, out=out)
+    if out is not None:
+        raise ValueError("out= is only supported for NumPy array inputs")
+    return _normalise_impl(arr, eps)
+
+
+@jit
+def _magnitude_impl(arr: jnp.ndarray) -> jnp.ndarray:
+    """Jitted core of magnitude; shape checks live in the wrapper."""
+    # useing float64, as integer overflow sometimes gives nan results! - Note, things are set so float32 will be returned
+    arr = arr.astype(jnp.float64)
+    # einsum contracts the squares in the same sweep that forms them, so no
+    # squared intermediate is materialised before the reduction.
+    return jnp.sqrt(jnp.einsum("...i,...i->...", arr, arr))
 
 
 @jit
-def magnitude(arr: jnp.ndarray) -> jnp.ndarray:
+def _magnitude_safe_impl(arr: jnp.ndarray) -> jnp.ndarray:
+    """Overflow-guarded magnitude: rescale by the largest component so the
+    squares cannot overflow, LAPACK-style, then scale the result back."""
+    arr = arr.astype(jnp.float64)
+    scale = jnp.max(jnp.abs(arr), axis=-1, keepdims=True)
+    scale = jnp.maximum(scale, 1e-300)  # keep zero vectors finite
+    scaled = arr / scale
+    return scale[..., 0] * jnp.sqrt(jnp.einsum("...i,...i->...", scaled, scaled))
+
+
+def magnitude(
+    arr: jnp.ndarray, out: np.ndarray | None = None, safe: bool = False
+) -> jnp.ndarray:
     """Calculate the Euclidean norm (magnitude) of a given vector or set of vectors.
 
     Parameters
     ----------
     arr : jnp.ndarray
         Input array, expected to be either 1D or 2D.
+    out : np.ndarray | None, optional
+        Pre-allocated result buffer, honoured on the NumPy fast path only.
+    safe : bool, optional
+        If True, rescale by the largest component before squaring so inputs
+        with elements beyond ~1e154 cannot overflow to inf. The default
+        fast path skips the guard (default: False).
 
     Returns
     -------
@@ -43,31 +107,77 @@ def magnitude(arr: jnp.ndarray) -> jnp.ndarray:
     """
     if arr.ndim not in {1, 2}:
         return jnp.full((), jnp.nan)  # Return a scalar NaN instead of full_like(arr)
+    if isinstance(arr, np.ndarray):
+        return magnitude_np(arr, out=out, safe=safe)
+    if out is not None:
+        raise ValueError("out= is only supported for NumPy array inputs")
+    return _magnitude_safe_impl(arr) if safe else _magnitude_impl(arr)
 
-    # useing float64, as integer overflow sometimes gives nan results! - Note, things are set so float32 will be returned
-    arr = arr.astype(jnp.float64)
-    return jnp.sqrt(
-        jnp.sum(arr**2, axis=-1)
-    )  # Equivalent to jnp.linalg.norm but faster
+
+@jit
+def normalise3(arr: jnp.ndarray) -> jnp.ndarray:
+    """Normalise 3D vectors with a fused reciprocal square root.
+
+    Specialised fast path for the common 3-component case: the squared norm
+    is accumulated component-wise and scaled through lax.rsqrt (a single
+    hardware instruction on GPU/TPU) instead of a sqrt followed by a divide.
+    Use normalise for vectors of other dimensionality.
+
+    Parameters
+    ----------
+    arr : jnp.ndarray
+        A 3D vector or stack of 3D vectors, shape (..., 3).
+
+    Returns
+    -------
+    jnp.ndarray
+        Unit vectors with the same shape as the input.
+    """
+    s = arr * arr
+    inv = lax.rsqrt(s[..., 0] + s[..., 1] + s[..., 2] + 1e-24)
+    return arr * inv[..., None]
 
 
 @jit
-def euclidean_dist(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
-    """Calculate the pairwise Euclidean distance between two sets of points.
+def magnitude3(arr: jnp.ndarray) -> jnp.ndarray:
+    """Euclidean norm of 3D vectors, accumulated component-wise.
 
     Parameters
     ----------
-    v1 : jnp.ndarray
-        An array representing a single point or a collection of points.
-    v2 : jnp.ndarray
-        An array representing a single point or a collection of points.
+    arr : jnp.ndarray
+        A 3D vector or stack of 3D vectors, shape (..., 3).
 
     Returns
     -------
     jnp.ndarray
-        An array of Euclidean distances between corresponding points in v1 and v2.
-        If both inputs are 2D and have different numbers of rows, returns NaNs.
+        The magnitude(s) of the input, shape (...,).
+    """
+    s = arr * arr
+    return jnp.sqrt(s[..., 0] + s[..., 1] + s[..., 2])
+
+
+@jit
+def squared_magnitude(arr: jnp.ndarray) -> jnp.ndarray:
+    """Squared Euclidean norm along the last axis, skipping the sqrt.
+
+    Useful where callers only need to compare or order lengths.
+
+    Parameters
+    ----------
+    arr : jnp.ndarray
+        A vector or stack of vectors.
+
+    Returns
+    -------
+    jnp.ndarray
+        The squared magnitude(s) of the input, shape (...,).
     """
+    return jnp.einsum("...i,...i->...", arr, arr)
+
+
+@jit
+def _euclidean_dist_impl(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
+    """Jitted core of euclidean_dist."""
     v1, v2 = jnp.atleast_2d(v1), jnp.atleast_2d(v2)
 
     # Case 1: Both 2D with matching rows
@@ -77,10 +187,14 @@ def euclidean_dist(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
     # case 3: v2 is a single vector
     cond3 = v2.shape[0] == 1
 
-    # Compute pairwise distances where valid
+    # Compute pairwise distances where valid. The einsum contracts the
+    # squared differences in the same sweep that forms them, so XLA fuses
+    # subtract, square and reduce into a single pass with no intermediate
+    # buffer beyond the difference itself.
+    diff = v1 - v2
     distances = jnp.where(
         cond1 | cond2 | cond3,
-        jnp.linalg.norm(v1 - v2, axis=1),
+        jnp.sqrt(jnp.einsum("ij,ij->i", diff, diff)),
         jnp.full(
             (max(v1.shape[0], v2.shape[0]),), jnp.nan
         ),  # Return NaNs for invalid cases
@@ -88,8 +202,108 @@ def euclidean_dist(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
     return distances
 
 
+def euclidean_dist(
+    v1: jnp.ndarray, v2: jnp.ndarray, out: np.ndarray | None = None
+) -> jnp.ndarray:
+    """Calculate the pairwise Euclidean distance between two sets of points.
+
+    Parameters
+    ----------
+    v1 : jnp.ndarray
+        An array representing a single point or a collection of points.
+    v2 : jnp.ndarray
+        An array representing a single point or a collection of points.
+    out : np.ndarray | None, optional
+        Pre-allocated result buffer, honoured on the NumPy fast path only.
+
+    Returns
+    -------
+    jnp.ndarray
+        An array of Euclidean distances between corresponding points in v1 and v2.
+        If both inputs are 2D and have different numbers of rows, returns NaNs.
+
+    See Also
+    --------
+    euclidean_dist_allpairs : full distance matrix between two point sets,
+        computed as a single GEMM via the norm-expansion identity — use it
+        for many-vs-many queries instead of looping over this function.
+    """
+    if isinstance(v1, np.ndarray) and isinstance(v2, np.ndarray):
+        return euclidean_dist_np(v1, v2, out=out)
+    if out is not None:
+        raise ValueError("out= is only supported for NumPy array inputs")
+    return _euclidean_dist_impl(v1, v2)
+
+
+@partial(jit, static_argnames=("tile_size",))
+def euclidean_dist_allpairs(
+    v1: jnp.ndarray, v2: jnp.ndarray, tile_size: int = 1024
+) -> jnp.ndarray:
+    """Calculate the full matrix of Euclidean distances between two point sets.
+
+    Uses the expansion ||a - b||^2 = ||a||^2 + ||b||^2 - 2 a.b, so the bulk
+    of the work is a single matrix product and two small squared-norm
+    reductions, instead of materialising an (n, m, d) difference array. The
+    squared norms of either set can therefore be reused across queries by XLA.
+
+    Parameters
+    ----------
+    v1 : jnp.ndarray
+        A point or array of points, shape (n, d) or (d,).
+    v2 : jnp.ndarray
+        A point or array of points, shape (m, d) or (d,).
+    tile_size : int, optional
+        When n exceeds this, the rows of v1 are streamed through a lax.map
+        in blocks of this size, so each step works on a cache-friendly
+        (tile_size, m) panel instead of the full (n, m) product at once
+        (default: 1024).
+
+    Returns
+    -------
+    jnp.ndarray
+        An (n, m) array where entry [i, j] is the distance between v1[i]
+        and v2[j].
+    """
+    v1, v2 = jnp.atleast_2d(v1), jnp.atleast_2d(v2)
+    n, d = v1.shape
+    # The squared norms of v2 are computed once and reused by every block.
+    sq2 = jnp.einsum("ij,ij->i", v2, v2)
+
+    def _block(rows):
+        sq1 = jnp.einsum("ij,ij->i", rows, rows)
+        d2 = sq1[:, None] + sq2[None, :] - 2.0 * (rows @ v2.T)
+        # Clamp tiny negative values from cancellation before the sqrt.
+        return jnp.sqrt(jnp.maximum(d2, 0.0))
+
+    if n <= tile_size:
+        return _block(v1)
+
+    pad = (-n) % tile_size
+    vp = jnp.concatenate([v1, jnp.zeros((pad, d), v1.dtype)]) if pad else v1
+    blocks = vp.reshape(-1, tile_size, d)
+    out = lax.map(_block, blocks).reshape(-1, v2.shape[0])
+    return out[:n]
+
+
 @jit
-def reject(v: jnp.ndarray, from_v: jnp.ndarray) -> jnp.ndarray:
+def _reject_impl(v: jnp.ndarray, from_v: jnp.ndarray) -> jnp.ndarray:
+    """Jitted core of reject."""
+    # All reductions run along the trailing axis, so 1D and 2D inputs (and
+    # any 1-vs-N mix) broadcast against each other without reshaping; the
+    # output rank simply follows the broadcast inputs.
+    dot_v_from_v = jnp.einsum("...i,...i->...", v, from_v)[..., None]
+    dot_from_v_from_v = jnp.einsum("...i,...i->...", from_v, from_v)[..., None]
+
+    # Compute the projection of v onto from_v.
+    projection = (dot_v_from_v / (dot_from_v_from_v + 1e-10)) * from_v
+
+    # The rejection is v minus its projection onto from_v.
+    return v - projection
+
+
+def reject(
+    v: jnp.ndarray, from_v: jnp.ndarray, out: np.ndarray | None = None
+) -> jnp.ndarray:
     """
     Compute the rejection of the input vector v from the reference vector from_v.
 
@@ -115,36 +329,38 @@ def reject(v: jnp.ndarray, from_v: jnp.ndarray) -> jnp.ndarray:
         * If both inputs are single vectors, a 1D vector is returned.
         * Otherwise, a 2D array is returned.
     """
-    # Save whether the inputs were originally 1D.
-    orig_v_is_1d = v.ndim == 1
-    orig_from_v_is_1d = from_v.ndim == 1
-
-    # Convert both inputs to at least 2D.
-    v = jnp.atleast_2d(v)  # Now shape is (a, N)
-    from_v = jnp.atleast_2d(from_v)  # Now shape is (b, N)
-
-    # If both inputs are multi-vector (i.e. more than one row) but their batch sizes differ,
-    # we cannot do pairwise rejection. (We allow one of them to be a singleton.)
-    if (v.shape[0] != from_v.shape[0]) and (v.shape[0] != 1) and (from_v.shape[0] != 1):
-        raise ValueError(
-            "If both v and from_v are multi-vector, they must have the same number of rows."
-        )
-
-    # Compute dot products along the last axis.
-    dot_v_from_v = jnp.sum(v * from_v, axis=-1, keepdims=True)
-    dot_from_v_from_v = jnp.sum(from_v * from_v, axis=-1, keepdims=True)
-
-    # Compute the projection of v onto from_v.
-    projection = (dot_v_from_v / (dot_from_v_from_v + 1e-10)) * from_v
+    if isinstance(v, np.ndarray) and isinstance(from_v, np.ndarray):
+        return reject_np(v, from_v, out=out)
+    if out is not None:
+        raise ValueError("out= is only supported for NumPy array inputs")
+    return _reject_impl(v, from_v)
+
+def _cross3(
+    v1: jnp.ndarray, v2: jnp.ndarray
+) -> tuple[jnp.ndarray, jnp.ndarray, jnp.ndarray]:
+    """Components of the 3D cross product as straight-line arithmetic.
+
+    Returning the components separately lets callers contract them
+    (magnitude, triple product) without stacking an intermediate (..., 3)
+    array; the explicit mul/sub pairs lower to FMAs. Traced inline from
+    jitted callers.
+    """
+    cx = v1[..., 1] * v2[..., 2] - v1[..., 2] * v2[..., 1]
+    cy = v1[..., 2] * v2[..., 0] - v1[..., 0] * v2[..., 2]
+    cz = v1[..., 0] * v2[..., 1] - v1[..., 1] * v2[..., 0]
+    return cx, cy, cz
 
-    # The rejection is v minus its projection onto from_v.
-    result = v - projection
 
-    # If both inputs were originally 1D, squeeze out the added batch dimension.
-    if orig_v_is_1d and orig_from_v_is_1d:
-        result = result[0]
+@jit
+def _reject_pair(
+    v1: jnp.ndarray, v2: jnp.ndarray, n: jnp.ndarray
+) -> tuple[jnp.ndarray, jnp.ndarray]:
+    """Reject both v1 and v2 from n, computing the n.n denominator once."""
+    nn = jnp.einsum("...i,...i->...", n, n)[..., None] + 1e-10
+    v1 = v1 - (jnp.einsum("...i,...i->...", v1, n)[..., None] / nn) * n
+    v2 = v2 - (jnp.einsum("...i,...i->...", v2, n)[..., None] / nn) * n
+    return v1, v2
 
-    return result
 
 @jit
 def dot(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
@@ -171,33 +387,17 @@ def dot(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
         The dot product computed element-wise. If both inputs were originally 1D,
         returns a scalar; otherwise returns an array.
     """
-    # Record whether the original inputs were 1D.
-    orig_v1_is_1d = (v1.ndim == 1)
-    orig_v2_is_1d = (v2.ndim == 1)
-
-    # Convert to at least 2D so that broadcasting works uniformly.
-    v1 = jnp.atleast_2d(v1)
-    v2 = jnp.atleast_2d(v2)
-
-    # Ensure broadcastability along the first axis.
-    if (v1.shape[0] != v2.shape[0]) and (v1.shape[0] != 1) and (v2.shape[0] != 1):
-        raise ValueError("v1 and v2 must have the same number of rows or be broadcastable.")
-
-    # Handle broadcasting by expanding the singleton dimension if necessary.
-    if v1.shape[0] == 1:
-        v1 = jnp.broadcast_to(v1, (v2.shape[0], v1.shape[-1]))
-    if v2.shape[0] == 1:
-        v2 = jnp.broadcast_to(v2, (v1.shape[0], v2.shape[-1]))
-
-    # normalise
-    norm_v1 = normalise(v1)
-    norm_v2 = normalise(v2)
-
-    # Compute the dot product along the last axis.
-    dp = jnp.sum(norm_v1 * norm_v2, axis=-1)
-
-    # If both inputs were originally 1D, return a scalar.
-    return dp[0] if orig_v1_is_1d and orig_v2_is_1d else dp
+    # Normalising both inputs and dotting them is algebraically
+    # (v1 . v2) / (|v1| |v2|); fusing it into one contraction per input
+    # plus a single rsqrt makes one pass over each operand instead of a
+    # normalise pass each and a third for the product. Trailing-axis ops
+    # broadcast 1D against 2D naturally, so the output rank follows the
+    # inputs (scalar for two single vectors).
+    dp = jnp.einsum("...i,...i->...", v1, v2)
+    ss = jnp.einsum("...i,...i->...", v1, v1) * jnp.einsum(
+        "...i,...i->...", v2, v2
+    )
+    return dp * lax.rsqrt(jnp.maximum(ss, 1e-24))
 @jit
 def cross(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
     """
@@ -241,9 +441,14 @@ def cross(v1: jnp.ndarray, v2: jnp.ndarray) -> jnp.ndarray:
     if v2.shape[0] == 1:
         v2 = jnp.broadcast_to(v2, v1.shape)
     
-    # Compute the cross product element-wise.
-    cp = jnp.cross(v1, v2)
-   
+    # Compute the cross product element-wise. For 3D vectors use the
+    # unrolled component helper: the explicit mul/sub pairs contract to FMAs
+    # and skip jnp.cross's generic axis shuffling.
+    if v1.shape[-1] == 3 and v2.shape[-1] == 3:
+        cp = jnp.stack(_cross3(v1, v2), axis=-1)
+    else:
+        cp = jnp.cross(v1, v2)
+
     # If both inputs were originally 1D, return a single (1D) vector.
     return cp[0] if orig_v1_is_1d and orig_v2_is_1d else cp
 
@@ -310,7 +515,48 @@ def center_points(pnts:jnp.ndarray, center:jnp.ndarray | None = None) -> jnp.nda
 @jit
 def _mat_mul(a: jnp.ndarray, b: jnp.ndarray) -> jnp.ndarray:
     return a @ b
-@jit
+@partial(jit, static_argnames=("assume_normalized", "to_degree"))
+def _angle_impl(
+    v1: jnp.ndarray,
+    v2: jnp.ndarray,
+    plane_normal: jnp.ndarray | None = None,
+    assume_normalized: bool = False,
+    to_degree: bool = False,
+) -> jnp.ndarray:
+    """Jitted core of angle; always returns a JAX array."""
+
+    # If a plane_normal is provided, apply rejection (sharing the n.n term).
+    if plane_normal is not None:
+        v1, v2 = _reject_pair(v1, v2, plane_normal)
+
+    # All reductions run along the trailing axis, so 1D and 2D inputs
+    # broadcast naturally and the output rank follows the inputs (a scalar
+    # for two single vectors, a 1D array otherwise).
+    dot_products = jnp.einsum("...i,...i->...", v1, v2)
+
+    # atan2(|v1 x v2|, v1 . v2) is exact near 0 and pi where arccos loses
+    # precision, and because atan2 is scale-invariant no normalisation is
+    # needed: the cross magnitude comes from the Lagrange identity
+    # |a|^2 |b|^2 - (a.b)^2, which works in any dimension. When the inputs
+    # are known to be unit vectors the squared-norm product collapses to 1.
+    if assume_normalized:
+        cross_sq = 1.0 - dot_products * dot_products
+    else:
+        cross_sq = (
+            jnp.einsum("...i,...i->...", v1, v1)
+            * jnp.einsum("...i,...i->...", v2, v2)
+            - dot_products * dot_products
+        )
+    angles = jnp.arctan2(jnp.sqrt(jnp.maximum(cross_sq, 0.0)), dot_products)
+
+    # Convert to degrees if requested (to_degree is static, so this is just
+    # a constant multiply folded into the graph)
+    if to_degree:
+        angles = angles * _RAD2DEG
+
+    return angles
+
+
 def angle(
     v1: jnp.ndarray,
     v2: jnp.ndarray,
@@ -331,6 +577,9 @@ def angle(
         Normal vector of the plane to project v1 and v2 onto, by default None.
     assume_normalized : bool, optional
         Indicates whether the input vectors are already normalized, by default False.
+        When True no normalisation work is traced at all — not even the
+        squared-norm reductions — so callers are responsible for actually
+        supplying unit vectors.
     to_degree : bool, optional
         If True, returns the angle in degrees; otherwise in radians, by default False.
 
@@ -339,56 +588,45 @@ def angle(
     jnp.ndarray | float
         The angle between v1 and v2. Returns a scalar if both inputs are 1D, otherwise an array.
     """
+    if isinstance(v1, np.ndarray) and isinstance(v2, np.ndarray):
+        return angle_np(v1, v2, plane_normal, assume_normalized, to_degree)
+    return _angle_impl(v1, v2, plane_normal, assume_normalized, to_degree)
 
-    # Record original shape to determine return type
-    orig_v1_is_1d = v1.ndim == 1
-    orig_v2_is_1d = v2.ndim == 1
 
-    # If a plane_normal is provided, apply rejection.
+@partial(jit, static_argnames=("to_degree",))
+def _signed_angle_impl(
+    v1: jnp.ndarray, v2: jnp.ndarray, plane_normal: jnp.ndarray, to_degree: bool = False
+) -> jnp.ndarray:
+    """Jitted core of signed_angle; always returns a JAX array."""
+    # Project v1 and v2 by rejection, sharing the normal's squared-norm term
+    # between the two rejections.
     if plane_normal is not None:
-        v1 = reject(v1, plane_normal)
-        v2 = reject(v2, plane_normal)
-
-    # Convert both to at least 2D (ensures broadcasting works correctly)
-    v1 = jnp.atleast_2d(v1)
-    v2 = jnp.atleast_2d(v2)
-
-    # Ensure broadcastability along the first axis
-    if (v1.shape[0] != v2.shape[0]) and (v1.shape[0] != 1) and (v2.shape[0] != 1):
-        raise ValueError(
-            "v1 and v2 must have the same number of rows or be broadcastable."
-        )
-
-    # Handle broadcasting by expanding the singleton dimension if necessary
-    if v1.shape[0] == 1:
-        v1 = jnp.broadcast_to(v1, v2.shape)
-    if v2.shape[0] == 1:
-        v2 = jnp.broadcast_to(v2, v1.shape)
-
-    # Compute dot product along the last axis
-    dot_products = jnp.sum(v1 * v2, axis=-1)
-
-    # Compute magnitudes without keeping dimensions
-    magnitudes = magnitude(v1) * magnitude(v2)
-
-    # Compute cosines, handle normalization errors
-    cosines = jnp.where(
-        assume_normalized, dot_products, dot_products / (magnitudes + 1e-10)
-    )
-
-    # Compute the angle (in radians) and clip to safe numerical range
-    angles = jnp.arccos(jnp.clip(cosines, -1.0, 1.0))
-
-    # Convert to degrees if requested
-    angles = lax.cond(to_degree, lambda a: jnp.degrees(a), lambda a: a, angles)
+        v1, v2 = _reject_pair(v1, v2, plane_normal)
+
+    # One sweep over the components: the cross-product terms feed both the
+    # magnitude (numerator of the atan2) and the triple product with the
+    # normal (the sign), and the dot product completes the atan2. atan2 is
+    # scale-invariant, so no magnitudes or epsilon-guarded divides are
+    # needed, and it is exact near 0 and pi where arccos was lossy.
+    dot_products = jnp.einsum("...i,...i->...", v1, v2)
+    cx, cy, cz = _cross3(v1, v2)
+    cross_mag = jnp.sqrt(cx * cx + cy * cy + cz * cz)
+    angle_rad = jnp.arctan2(cross_mag, dot_products)
+
+    n = plane_normal
+    det = n[..., 0] * cx + n[..., 1] * cy + n[..., 2] * cz
+    # Replace zero sign (collinear case) with +1; the algebraic form avoids
+    # the select that jnp.where(sign == 0, 1, sign) would compile to.
+    sign = jnp.sign(det)
+    sign = sign + (det == 0).astype(sign.dtype)
+    signed_angle_rad = sign * angle_rad
 
-    # Ensure correct return type
-    if orig_v1_is_1d and orig_v2_is_1d:
-        return angles[0]  # Return a float for single vectors
-    return angles  # Return a 1D array otherwise
+    # Optionally convert to degrees (static flag; a constant multiply).
+    if to_degree:
+        return signed_angle_rad * _RAD2DEG
+    return signed_angle_rad
 
 
-@jit
 def signed_angle(
     v1: jnp.ndarray, v2: jnp.ndarray, plane_normal: jnp.ndarray, to_degree: bool = False
 ) -> jnp.ndarray:
@@ -406,55 +644,7 @@ def signed_angle(
     Returns:
       The signed angle between v1 and v2.
     """
-    # Record original dimensionality.
-    orig_v1_is_1d = v1.ndim == 1
-    orig_v2_is_1d = v2.ndim == 1
-    orig_normal_is_1d = plane_normal.ndim == 1
-
-    # If a plane normal is provided, project v1 and v2 by rejection.
-    if plane_normal is not None:
-        # (Assume reject() is defined elsewhere.)
-        v1 = reject(v1, plane_normal)
-        v2 = reject(v2, plane_normal)
-
-    # Ensure both inputs are at least 2D.
-    v1 = jnp.atleast_2d(v1)
-    v2 = jnp.atleast_2d(v2)
-
-    # Handle broadcasting if one input is a single vector.
-    if (v1.shape[0] != v2.shape[0]) and (v1.shape[0] != 1) and (v2.shape[0] != 1):
-        raise ValueError(
-            "v1 and v2 must have the same number of rows or be broadcastable."
-        )
-    if v1.shape[0] == 1:
-        v1 = jnp.broadcast_to(v1, v2.shape)
-    if v2.shape[0] == 1:
-        v2 = jnp.broadcast_to(v2, v1.shape)
-
-    # Compute dot products and magnitudes.
-    dot_products = jnp.sum(v1 * v2, axis=-1)
-    mags = magnitude(v1) * magnitude(v2)
-    # Compute cosine values (adding a tiny constant to avoid division by zero).
-    cosines = dot_products / (mags + 1e-10)
-    # Clamp to safe numerical range and compute the unsigned angle.
-    angle_rad = jnp.arccos(jnp.clip(cosines, -1.0, 1.0))
-
-    # Determine the sign via cross products with the plane normal.
-    cross_prod = jnp.cross(v1, v2)
-    sign = jnp.sign(jnp.sum(cross_prod * jnp.atleast_2d(plane_normal), axis=-1))
-    # Replace zero sign (collinear case) with +1.
-    sign = jnp.where(sign == 0, 1, sign)
-    signed_angle_rad = sign * angle_rad
-
-    # Optionally convert to degrees.
-    out_angle = lax.cond(
-        to_degree, lambda a: jnp.degrees(a), lambda a: a, signed_angle_rad
-    )
-
-    # If all inputs were originally 1D, return a scalar (as a JAX array scalar).
-    if orig_v1_is_1d and orig_v2_is_1d and orig_normal_is_1d:
-        return out_angle[0]
-    return out_angle
+    return _signed_angle_impl(v1, v2, plane_normal, to_degree)
 
 def normalize_angle_array(angles):
     """
@@ -491,9 +681,14 @@ def normalize_angle_array(angles):
     
     return norm_angles
 
-@jit
+@partial(jit, static_argnames=("precision", "tile_size"))
 def robust_covariance_mest(
-    X: jnp.ndarray, c: float = 1.5, tol: float = 1e-6, max_iter: int = 100
+    X: jnp.ndarray,
+    c: float = 1.5,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    precision: str = "float64",
+    tile_size: int = 4096,
 ) -> jnp.ndarray:
     """
     Compute a robust covariance matrix using an M‐estimator with a Huber‐like weighting scheme.
@@ -508,13 +703,34 @@ def robust_covariance_mest(
         Convergence tolerance (default: 1e-6).
     max_iter : int, optional
         Maximum number of iterations (default: 100).
+    precision : str, optional
+        If "bfloat16", the bandwidth-bound moment accumulations over X are
+        streamed in bfloat16 with float32 accumulators; mean and covariance
+        stay in full precision. Default "float64" keeps everything in full
+        precision.
+    tile_size : int, optional
+        When n_samples exceeds this, each iteration streams X through a
+        lax.scan in row blocks of this size, bounding the per-iteration
+        temporaries at O(tile_size * d) instead of O(n * d)
+        (default: 4096).
 
     Returns
     -------
     jnp.ndarray
         Robust covariance matrix of shape (n_features, n_features).
     """
+    allowed_precisions = ("float64", "bfloat16")
+    if precision not in allowed_precisions:
+        raise ValueError(
+            f"Given precision {precision} is not valid, expecting one of {allowed_precisions}"
+        )
+
     n, d = X.shape
+    # Optionally stream the per-iteration moment accumulations in bfloat16:
+    # X is cast once outside the loop and the contractions accumulate in
+    # float32 via preferred_element_type.
+    low_precision = precision == "bfloat16"
+    Xc = X.astype(jnp.bfloat16) if low_precision else X
     # Initialize with the classical mean and covariance.
     mu0 = jnp.mean(X, axis=0)
     diff0 = X - mu0
@@ -527,22 +743,75 @@ def robust_covariance_mest(
         mu, sigma, i, converged = state
         return jnp.logical_and(i < max_iter, jnp.logical_not(converged))
 
+    def _block_moments(Xt, Xct, mask, mu, chol):
+        """Weighted moment sums (Sw, SwX, SwXX) for one block of rows."""
+        diff = Xt - mu
+        # Cholesky + triangular solve is cheaper and stabler than an explicit
+        # inverse followed by a matmul; einsum keeps only the diagonal of the
+        # quadratic form.
+        z = cho_solve(chol, diff.T).T
+        mahal = jnp.einsum("ij,ij->i", diff, z)
+        # Downweight points with large Mahalanobis distances; padded rows are
+        # masked out entirely.
+        weights = jnp.where(mahal < c**2, 1.0, c**2 / mahal)
+        if mask is not None:
+            weights = weights * mask
+        if low_precision:
+            wc = weights.astype(jnp.bfloat16)
+            SwX = jnp.einsum(
+                "i,ij->j", wc, Xct, preferred_element_type=jnp.float32
+            ).astype(X.dtype)
+            SwXX = jnp.einsum(
+                "ij,i,ik->jk", Xct, wc, Xct, preferred_element_type=jnp.float32
+            ).astype(X.dtype)
+        else:
+            SwX = weights @ Xt
+            SwXX = Xt.T @ (weights[:, None] * Xt)
+        return jnp.sum(weights), SwX, SwXX
+
+    # For large n, stream X through the iteration in row tiles so the
+    # per-iteration temporaries stay O(tile_size * d) rather than O(n * d).
+    tiled = n > tile_size
+    if tiled:
+        pad = (-n) % tile_size
+        Xp = jnp.concatenate([X, jnp.zeros((pad, d), X.dtype)]) if pad else X
+        mask = jnp.concatenate(
+            [jnp.ones(n, X.dtype), jnp.zeros(pad, X.dtype)]
+        ) if pad else jnp.ones(n, X.dtype)
+        n_tiles = Xp.shape[0] // tile_size
+        X_tiles = Xp.reshape(n_tiles, tile_size, d)
+        Xc_tiles = X_tiles.astype(jnp.bfloat16) if low_precision else X_tiles
+        mask_tiles = mask.reshape(n_tiles, tile_size)
+
     def body_fn(state):
         mu, sigma, i, _ = state
-        diff = X - mu
-        # Add a small regularization term for numerical stability.
-        inv_sigma = jnp.linalg.inv(sigma + jnp.eye(d) * 1e-6)
-        # Compute squared Mahalanobis distances.
-        mahal = jnp.sum((diff @ inv_sigma) * diff, axis=1)
-        # Compute weights: downweight points with large Mahalanobis distances.
-        weights = jnp.where(mahal < c**2, 1.0, c**2 / mahal)
-        # Update the weighted mean.
-        new_mu = jnp.sum(weights[:, None] * X, axis=0) / jnp.sum(weights)
-        weighted_diff = X - new_mu
-        # Update the weighted covariance.
-        new_sigma = (weighted_diff.T @ (weights[:, None] * weighted_diff)) / jnp.sum(
-            weights
-        )
+        # Factorize once per iteration with a small regularization term.
+        chol = cho_factor(sigma + jnp.eye(d) * 1e-6)
+
+        if tiled:
+
+            def tile_step(carry, tile):
+                Sw_acc, SwX_acc, SwXX_acc = carry
+                Xt, Xct, mt = tile
+                Sw_t, SwX_t, SwXX_t = _block_moments(Xt, Xct, mt, mu, chol)
+                return (Sw_acc + Sw_t, SwX_acc + SwX_t, SwXX_acc + SwXX_t), None
+
+            (Sw, SwX, SwXX), _ = lax.scan(
+                tile_step,
+                (
+                    jnp.zeros((), X.dtype),
+                    jnp.zeros(d, X.dtype),
+                    jnp.zeros((d, d), X.dtype),
+                ),
+                (X_tiles, Xc_tiles, mask_tiles),
+            )
+        else:
+            Sw, SwX, SwXX = _block_moments(X, Xc, None, mu, chol)
+
+        # Derive mean and covariance from the accumulated moments
+        # (sigma = E_w[xx^T] - mu mu^T).
+        new_mu = SwX / Sw
+        new_sigma = SwXX / Sw - jnp.outer(new_mu, new_mu)
         # Check convergence (using the change in the mean).
         converged = jnp.linalg.norm(new_mu - mu) < tol
         return (new_mu, new_sigma, i + 1, converged)
@@ -551,124 +820,75 @@ def robust_covariance_mest(
     return sigma_final
 
 
-# @jit
-# def coord_eig_decomp(
-#     coords: jnp.ndarray,
-#     robust: bool = True,
-#     center: bool = False,
-#     PCA: bool = True,
-#     sort: bool = True,
-#     transpose: bool = True,
-# ) -> tuple[jnp.ndarray, jnp.ndarray]:
-#     """
-#     Compute the eigendecomposition of the covariance matrix for a set of coordinates,
-#     with options for robust covariance estimation and PCA normalization.
-
-#     Parameters
-#     ----------
-#     coords : jnp.ndarray
-#         Input coordinates of shape (n_samples, n_features).
-#     robust : bool, optional
-#         If True, use robust covariance estimation (default: True).
-#     center : bool, optional
-#         If True, center the data by subtracting the mean (default: False).
-#     PCA : bool, optional
-#         If True, normalize eigenvalues so that they represent the fraction of variance explained (default: True).
-#     sort : bool, optional
-#         If True, sort eigenvalues and eigenvectors in descending order (default: True).
-#     transpose : bool, optional
-#         If True, return eigenvectors as rows rather than columns (default: True).
-
-#     Returns
-#     -------
-#     tuple[jnp.ndarray, jnp.ndarray]
-#         A tuple containing:
-#           - eigenvalues (as a 1D array)
-#           - eigenvectors (as a 2D array, transposed if requested)
-#     """
-#     # (1) Conditionally center the coordinates.
-#     coords = lax.cond(center, lambda c: c - jnp.mean(c, axis=0), lambda c: c, coords)
-
-#     # (2) Compute the covariance matrix using robust estimation or the standard method.
-#     cov = lax.cond(
-#         robust,
-#         lambda c: robust_covariance_mest(c),
-#         lambda c: jnp.cov(c, rowvar=False, bias=True),
-#         coords,
-#     )
-
-#     # (3) Compute the eigendecomposition (using eigh for symmetric matrices).
-#     evals, evecs = jnp.linalg.eigh(cov)
-
-#     # (4) Conditionally normalize eigenvalues so that they sum to 1 (PCA mode).
-#     evals = lax.cond(PCA, lambda e: e / jnp.sum(e), lambda e: e, evals)
-
-#     # (5) Conditionally sort eigenvalues (and corresponding eigenvectors) in descending order.
-#     def sort_fn(args):
-#         ev, evec = args
-#         sort_inds = jnp.argsort(ev)[::-1]
-#         return (ev[sort_inds], evec[:, sort_inds])
-
-#     evals, evecs = lax.cond(sort, sort_fn, lambda args: args, (evals, evecs))
-
-#     # (6) Conditionally transpose the eigenvector matrix.
-#     evecs = lax.cond(transpose, lambda ev: ev.T, lambda ev: ev, evecs)
-
-#     return evals, evecs
-
-# @jit
-# def coord_eig_decomp(
-#     coords: jnp.ndarray,
-#     robust: bool = True,
-#     center: bool = False,
-#     PCA: bool = True,
-#     sort: bool = True,
-#     transpose: bool = True,
-# ) -> tuple[jnp.ndarray, jnp.ndarray]:
-#     """
-#     Compute the eigendecomposition of the covariance matrix for a set of coordinates,
-#     with options for robust covariance estimation and PCA normalization.
-#     """
-#     # Center the coordinates if needed.
-#     coords = lax.cond(center, lambda c: c - jnp.mean(c, axis=0), lambda c: c, coords)
-
-#     # Handle degenerate cases: If all points are identical or degenerate, return zeros.
-#     if jnp.allclose(coords, coords[0]):
-#         return jnp.zeros(3), jnp.eye(3)
-
-#     # Compute covariance matrix using robust method or standard method.
-#     cov = lax.cond(
-#         robust,
-#         lambda c: robust_covariance_mest(c),
-#         lambda c: jnp.cov(c, rowvar=False, bias=True),
-#         coords,
-#     )
-
-#     # Compute eigen decomposition.
-#     evals, evecs = jnp.linalg.eigh(cov)
-
-#     # Normalize eigenvalues if PCA is enabled.
-#     evals = lax.cond(PCA, lambda e: e / jnp.sum(e), lambda e: e, evals)
-
-#     # Sort eigenvalues and eigenvectors in descending order.
-#     def sort_fn(args):
-#         ev, evec = args
-#         sort_inds = jnp.argsort(ev)[::-1]
-#         return ev[sort_inds], evec[:, sort_inds]
-
-#     evals, evecs = lax.cond(sort, sort_fn, lambda args: args, (evals, evecs))
-
-#     # Ensure handedness (right-hand rule) by checking determinant.
-#     if jnp.linalg.det(evecs) < 0:
-#         evecs = evecs.at[:, 0].set(-evecs[:, 0])  # Flip one axis to maintain orientation.
-
-#     # Transpose if requested.
-#     evecs = lax.cond(transpose, lambda ev: ev.T, lambda ev: ev, evecs)
-
-#     return evals, evecs
+@jit
+def robust_covariance_mest_masked(
+    X: jnp.ndarray,
+    mask: jnp.ndarray,
+    c: float = 1.5,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> jnp.ndarray:
+    """
+    Masked variant of robust_covariance_mest for padded inputs.
 
+    Rows whose mask entry is 0 contribute to no statistic, so datasets of
+    different sizes can be padded to a common shape and batched through
+    vmap or lax.map against a single compiled trace.
 
-@jit
+    Parameters
+    ----------
+    X : jnp.ndarray
+        Input data of shape (n_samples, n_features); padded rows may hold
+        any value.
+    mask : jnp.ndarray
+        Shape (n_samples,), 1 for valid rows and 0 for padding.
+    c : float, optional
+        Tuning constant for the Huber‐like weight function (default: 1.5).
+    tol : float, optional
+        Convergence tolerance (default: 1e-6).
+    max_iter : int, optional
+        Maximum number of iterations (default: 100).
+
+    Returns
+    -------
+    jnp.ndarray
+        Robust covariance matrix of shape (n_features, n_features).
+    """
+    n, d = X.shape
+    m = mask.astype(X.dtype)
+    Sm = jnp.sum(m)
+    # Initialize with the masked classical mean and covariance.
+    mu0 = (m @ X) / Sm
+    diff0 = (X - mu0) * m[:, None]
+    sigma0 = (diff0.T @ diff0) / Sm
+
+    state0 = (mu0, sigma0, 0, False)
+
+    def cond_fn(state):
+        mu, sigma, i, converged = state
+        return jnp.logical_and(i < max_iter, jnp.logical_not(converged))
+
+    def body_fn(state):
+        mu, sigma, i, _ = state
+        diff = X - mu
+        chol = cho_factor(sigma + jnp.eye(d) * 1e-6)
+        z = cho_solve(chol, diff.T).T
+        mahal = jnp.einsum("ij,ij->i", diff, z)
+        # Huber-like weights, with padded rows masked out entirely.
+        weights = jnp.where(mahal < c**2, 1.0, c**2 / mahal) * m
+        Sw = jnp.sum(weights)
+        SwX = weights @ X
+        SwXX = X.T @ (weights[:, None] * X)
+        new_mu = SwX / Sw
+        new_sigma = SwXX / Sw - jnp.outer(new_mu, new_mu)
+        converged = jnp.linalg.norm(new_mu - mu) < tol
+        return (new_mu, new_sigma, i + 1, converged)
+
+    mu_final, sigma_final, _, _ = lax.while_loop(cond_fn, body_fn, state0)
+    return sigma_final
+
+
+@partial(jit, static_argnames=("to_degree",))
 def minimum_theta(
     v1: jnp.ndarray, v2: jnp.ndarray, plane_normal: jnp.ndarray, to_degree: bool = False
 ) -> jnp.ndarray:
@@ -689,18 +909,27 @@ def minimum_theta(
     Returns:
       A JAX array scalar (or batch) with the minimal signed angle.
     """
-    # Compute the signed angle (in radians) between v1 and v2 (after projection).
-    angle_rad = signed_angle(v1, v2, plane_normal, to_degree=False)
-
-    # Adjust: if the absolute angle exceeds π/2, flip by subtracting sign(angle)*π.
-    minimal_angle_rad = jnp.where(
-        jnp.abs(angle_rad) > (jnp.pi / 2),
-        angle_rad - jnp.sign(angle_rad) * jnp.pi,
-        angle_rad,
-    )
-
-    # Optionally convert to degrees using lax.cond for JIT compatibility.
-    return lax.cond(to_degree, lambda a: jnp.degrees(a), lambda a: a, minimal_angle_rad)
+    # Project both vectors onto the plane, sharing the normal's squared norm.
+    v1, v2 = _reject_pair(v1, v2, plane_normal)
+
+    # atan2 of the triple product against |dot| folds the obtuse case over
+    # directly: one atan2 instead of arccos + sign + flip, and more accurate
+    # near 0 and pi/2. Negating when the dot is negative picks the acute
+    # representative with the same orientation as the old flip.
+    dot_products = jnp.einsum("...i,...i->...", v1, v2)
+    n = plane_normal
+    cx, cy, cz = _cross3(v1, v2)
+    # The triple product scales with |n|, so only its sign may feed the
+    # atan2; the magnitude comes from the cross product itself (which lies
+    # along n after the rejection). This keeps the result independent of
+    # the plane normal's length, as in signed_angle.
+    det = n[..., 0] * cx + n[..., 1] * cy + n[..., 2] * cz
+    cross_mag = jnp.sqrt(cx * cx + cy * cy + cz * cz)
+    minimal = jnp.arctan2(jnp.sign(det) * cross_mag, jnp.abs(dot_products))
+    minimal_angle_rad = jnp.where(dot_products < 0, -minimal, minimal)
+
+    # Optionally convert to degrees (static flag; a constant multiply).
+    return minimal_angle_rad * _RAD2DEG if to_degree else minimal_angle_rad
 
 
 @jit
@@ -797,105 +1026,7 @@ def rotate_around_axis(coords: jnp.ndarray, theta, axis: jnp.ndarray) -> jnp.nda
         return rotated_3d
 
 
-# @jit
-# def align_point_cloud(
-#     coords: jnp.ndarray,
-#     order: jnp.ndarray,
-#     target_basis: jnp.ndarray,
-#     robust: bool,
-#     center: bool,
-#     center_coord: jnp.ndarray = jnp.zeros(3),
-# ) -> jnp.ndarray:
-#     """Aligns a point cloud by centering it (using a mean or provided offset), extracting its eigenvectors via a robust decomposition, reordering and sign-correcting them against a target basis, and finally applying the corresponding rotation.
-
-#     Parameters
-#     ----------
-#     coords : jnp.ndarray
-#         The input point cloud coordinates.
-#     order : jnp.ndarray
-#         Indices to reorder the eigenvectors.
-#     target_basis : jnp.ndarray
-#         The target basis for aligning the eigenvectors.
-#     robust : bool
-#         If True, use robust eigen decomposition.
-#     center : bool or jnp.ndarray
-#         If a boolean, indicates whether to center by subtracting the mean (True) or leave as is (False).
-#         Otherwise, it is used directly as the centering offset.
-
-#     Returns
-#     -------
-#     jnp.ndarray
-#         The rotated and aligned point cloud coordinates.
-#     """
-#     # Center the point cloud.
-#     # if isinstance(center, bool):
-#     #     centered = coords - (jnp.mean(coords, axis=0) if center else 0)
-#     # else:
-#     #     centered = coords - center
-
-#     # not 100% this will work and it is a bit hacky
-#     coords = lax.cond(center, lambda c: c - jnp.mean(c, axis=0), lambda c: c, coords)
-#     centered = coords + (center_coord - coords.mean(axis=0))
-
-#     # Get the eigen decomposition.
-#     _, eigvecs = coord_eig_decomp(centered, robust, False, False, True, True)
-#     # Reorder and sign-correct the eigenvectors.
-#     E = jnp.take(eigvecs, order, axis=0)
-#     dots = jnp.sum(E * target_basis, axis=1, keepdims=True)
-#     E_adjusted = E * jnp.where(dots < 0, -1.0, 1.0)
-#     # Compute overall rotation directly:
-#     R_total = jnp.matmul(target_basis.T, E_adjusted)
-#     rotated = jnp.matmul(centered, R_total.T)
-#     # we may need to re-center to the mean if wanted
-#     coords = lax.cond(center, lambda c: c - jnp.mean(c, axis=0), lambda c: c, rotated)
-#     centered = coords + (center_coord - coords.mean(axis=0))
-#     return centered
-
-# @jit
-# def align_point_cloud(
-#     coords: jnp.ndarray,
-#     order: jnp.ndarray,
-#     target_basis: jnp.ndarray,
-#     robust: bool,
-#     center: bool,
-#     center_coord: jnp.ndarray = jnp.zeros(3),
-# ) -> jnp.ndarray:
-#     """
-#     Aligns a point cloud by centering, performing eigen decomposition, reordering and sign-correcting
-#     eigenvectors, and applying the corresponding rotation.
-#     """
-#     # Center the point cloud.
-#     coords = lax.cond(center, lambda c: c - jnp.mean(c, axis=0), lambda c: c, coords)
-#     centered = coords + (center_coord - coords.mean(axis=0))
-
-#     # Compute eigen decomposition.
-#     _, eigvecs = coord_eig_decomp(centered, robust, center=True, PCA=True, sort=True, transpose=True)
-
-#     # Reorder eigenvectors.
-#     E = jnp.take(eigvecs, order, axis=0)
-
-#     # Adjust signs to match target basis.
-#     signs = jnp.sign(jnp.sum(E * target_basis, axis=1))
-#     E_adjusted = E * signs[:, None]
-
-#     # Handle non-orthogonal target bases by using pseudo-inverse.
-#     R_total = jnp.matmul(jnp.linalg.pinv(target_basis), E_adjusted)
-
-#     # Apply the rotation.
-#     rotated = jnp.matmul(centered, R_total.T)
-
-#     # Re-center if needed.
-#     coords = lax.cond(center, lambda c: c - jnp.mean(c, axis=0), lambda c: c, rotated)
-#     centered = coords + (center_coord - coords.mean(axis=0))
-
-#     # Ensure scale preservation by normalizing back to original scale.
-#     scale_factor = jnp.linalg.norm(coords) / jnp.linalg.norm(rotated)
-#     aligned = rotated * scale_factor
-
-#     return aligned
-
-
-@jit
+@partial(jit, static_argnames=("robust", "center", "PCA", "sort", "transpose"))
 def coord_eig_decomp(
     coords: jnp.ndarray,
     robust: bool = True,
@@ -906,27 +1037,32 @@ def coord_eig_decomp(
 ) -> tuple[jnp.ndarray, jnp.ndarray]:
     """
     Compute the eigendecomposition of the covariance matrix for a set of coordinates.
+
+    The boolean options are static, so only the requested branches are
+    compiled (in particular the robust M-estimator loop is only traced when
+    robust=True).
     """
-    coords = lax.cond(center, lambda c: c - jnp.mean(c, axis=0), lambda c: c, coords)
+    if center:
+        coords = coords - jnp.mean(coords, axis=0)
 
-    # Handle degenerate cases using lax.cond
+    # Handle degenerate cases using lax.cond (data-dependent, so it stays
+    # a runtime conditional)
     def degenerate_case(_):
         return jnp.zeros(coords.shape[1]), jnp.eye(coords.shape[1])
 
     def non_degenerate_case(coords):
         # Compute covariance matrix
-        cov = lax.cond(
-            robust,
-            lambda c: robust_covariance_mest(c),
-            lambda c: jnp.cov(c, rowvar=False, bias=True),
-            coords,
-        )
+        if robust:
+            cov = robust_covariance_mest(coords)
+        else:
+            cov = jnp.cov(coords, rowvar=False, bias=True)
         evals, evecs = jnp.linalg.eigh(cov)
-        evals = lax.cond(PCA, lambda e: e / jnp.sum(e), lambda e: e, evals)
-        evals, evecs = lax.cond(
-            sort, lambda x: (x[0][::-1], x[1][:, ::-1]), lambda x: x, (evals, evecs)
-        )
-        evecs = lax.cond(transpose, lambda e: e.T, lambda e: e, evecs)
+        if PCA:
+            evals = evals / jnp.sum(evals)
+        if sort:
+            evals, evecs = evals[::-1], evecs[:, ::-1]
+        if transpose:
+            evecs = evecs.T
         return evals, evecs
 
     # Check if all points are identical (degenerate case)
@@ -935,7 +1071,7 @@ def coord_eig_decomp(
     return lax.cond(is_degenerate, degenerate_case, non_degenerate_case, coords)
 
 
-@jit
+@partial(jit, static_argnames=("robust", "center"))
 def align_point_cloud(
     coords: jnp.ndarray,
     order: jnp.ndarray,
@@ -955,15 +1091,14 @@ def align_point_cloud(
     def center_on_point(c):
         return c - jnp.mean(c, axis=0) + center_coord
 
-    # Conditionally center the point cloud
-    centered = lax.cond(
-        center,
-        lambda c: lax.cond(
-            jnp.all(center_coord == 0), center_on_mean, center_on_point, c
-        ),
-        lambda c: c,
-        coords,
-    )
+    # Conditionally center the point cloud (center is static; the choice of
+    # centring target depends on runtime data, so it stays a lax.cond)
+    if center:
+        centered = lax.cond(
+            jnp.all(center_coord == 0), center_on_mean, center_on_point, coords
+        )
+    else:
+        centered = coords
 
     # Compute eigen decomposition
     evals, eigvecs = coord_eig_decomp(
@@ -988,14 +1123,12 @@ def align_point_cloud(
     rotated = jnp.matmul(centered, R_total.T)
 
     # Conditionally re-center the point cloud after rotation
-    aligned = lax.cond(
-        center,
-        lambda r: lax.cond(
-            jnp.all(center_coord == 0), center_on_mean, center_on_point, r
-        ),
-        lambda r: r,
-        rotated,
-    )
+    if center:
+        aligned = lax.cond(
+            jnp.all(center_coord == 0), center_on_mean, center_on_point, rotated
+        )
+    else:
+        aligned = rotated
 
     return aligned
 
@@ -1111,3 +1244,34 @@ def origin_flip(starts: jnp.ndarray,stops:jnp.ndarray,method: str = 'away') -> j
         raise ValueError(f'Given method {method} is not valid, expecting one of {allowed_methods}')
 
 
+
+
+def warmup(dims: tuple[int, ...] = (2, 3)) -> None:
+    """Pre-compile the jitted kernels for common vector dimensionalities.
+
+    JAX compiles each jitted function on first call per input signature, a
+    one-off cost of up to hundreds of milliseconds that otherwise lands in
+    the middle of the caller's hot path. Calling warmup() once at start-up
+    moves that compilation out of the way; the executables are cached for
+    the rest of the process.
+
+    Parameters
+    ----------
+    dims : tuple[int, ...], optional
+        Vector dimensionalities to compile for, by default (2, 3).
+    """
+    # Warm through the public wrappers so the cache entries match how real
+    # callers reach the jitted cores (argument binding is part of the key).
+    for d in dims:
+        v = jnp.zeros(d)
+        b = jnp.zeros((2, d))
+        normalise(v), normalise(b)
+        magnitude(v), magnitude(b)
+        euclidean_dist(b, b)
+        reject(v, v), reject(b, b)
+        angle(v, v), angle(b, b)
+        if d == 3:
+            signed_angle(v, v, v)
+            minimum_theta(v, v, v)
+            normalise3(v)
+            magnitude3(v)
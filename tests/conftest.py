@@ -0,0 +1,36 @@
+import jax.random as jr
+import pytest
+
+import GeoJax
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_kernels():
+    """Compile the jitted kernels once before any test runs.
+
+    The core functions are jitted at module level, so the first call per
+    signature pays XLA compilation; warming them here keeps that one-off
+    cost out of individual tests and lets every test hit the compiled
+    executables directly.
+    """
+    GeoJax.warmup()
+
+
+@pytest.fixture(scope="session")
+def rng_data():
+    """Pre-materialised random datasets shared by the covariance tests.
+
+    Generating these once per session means each RNG kernel is compiled and
+    executed a single time instead of once per test that re-creates the
+    same PRNGKey and draw.
+    """
+    X = jr.normal(jr.PRNGKey(0), (100, 3))
+    return {
+        "gauss_100x3": X,
+        "gauss_100x5": jr.normal(jr.PRNGKey(42), (100, 5)),
+        # One fused scatter builds the outlier dataset from the same draw
+        # (the .at update returns a new array, so X itself is untouched):
+        # the last five rows are rescaled and shifted in place of a second
+        # normal draw and a concatenate.
+        "with_outliers": X.at[95:].set(10.0 + 5.0 * X[95:]),
+    }
@@ -0,0 +1,12 @@
+"""Shared device-resident test constants.
+
+Module-level jnp arrays are staged to the device once at import, so tests
+reuse the same buffers instead of re-building (and re-transferring) the
+same axis literals on every call.
+"""
+
+import jax.numpy as jnp
+
+E_X = jnp.array([1.0, 0.0, 0.0])
+E_Y = jnp.array([0.0, 1.0, 0.0])
+E_Z = jnp.array([0.0, 0.0, 1.0])